@@ -15,6 +15,12 @@
 # QuMADA. If not, see <https://www.gnu.org/licenses/>.
 #
 
-import qumada._version
 
-__version__ = qumada._version.__version__
+def __getattr__(name: str):
+    # Determining the version of an editable install runs versioningit, which is
+    # slow. Resolve it only when __version__ is actually requested.
+    if name == "__version__":
+        from qumada._version import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
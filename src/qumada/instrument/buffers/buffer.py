@@ -26,6 +26,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from typing import Any
 
+from jsonschema.validators import validator_for
 from qcodes.instrument import Instrument
 from qcodes.metadatable import Metadatable
 from qcodes.parameters import Parameter
@@ -267,6 +268,18 @@ class Buffer(ABC):
         "additionalProperties": False,
     }
 
+    # Compiled once, so setup_buffer does not have to check and compile the schema on every call
+    _settings_validator = validator_for(settings_schema)(settings_schema)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "settings_schema" in cls.__dict__:
+            cls._settings_validator = validator_for(cls.settings_schema)(cls.settings_schema)
+
+    def validate_settings(self, settings: dict) -> None:
+        """Validates the buffer settings against settings_schema."""
+        self._settings_validator.validate(settings)
+
     @abstractmethod
     def setup_buffer(self, settings: dict) -> None:
         """Sets instrument related settings for the buffer."""
@@ -26,7 +26,6 @@ Created on Tue Jan  3 15:20:07 2023
 from __future__ import annotations
 
 import numpy as np
-from jsonschema import validate
 from qcodes.parameters import Parameter
 
 from qumada.instrument.buffers import Buffer, BufferException
@@ -48,7 +47,7 @@ class DummyDMMBuffer(Buffer):
     def setup_buffer(self, settings: dict) -> None:
         """Sets instrument related settings for the buffer."""
 
-        validate(settings, self.settings_schema)
+        self.validate_settings(settings)
         self.settings: dict = settings
         self._device.buffer_SR(settings.setdefault("sampling_rate", 512))
         # self._device.buffer_trig_mode("OFF")
@@ -91,12 +90,15 @@ class DummyDMMBuffer(Buffer):
         -------
         None
         """
-        if all(k in self.settings for k in ("sampling_rate", "burst_duration", "num_points")):
+        sampling_rate = self.settings.get("sampling_rate")
+        burst_duration = self.settings.get("burst_duration")
+        num_points = self.settings.get("num_points")
+        if sampling_rate is not None and burst_duration is not None and num_points is not None:
             raise BufferException("You cannot define sampling_rate, burst_duration and num_points at the same time")
-        elif self.settings.get("num_points", False):
-            self.num_points = self.settings["num_points"]
-        elif all(k in self.settings for k in ("sampling_rate", "burst_duration")):
-            self.num_points = int(np.ceil(self.settings["sampling_rate"] * self.settings["burst_duration"]))
+        elif num_points:
+            self.num_points = num_points
+        elif sampling_rate is not None and burst_duration is not None:
+            self.num_points = int(np.ceil(sampling_rate * burst_duration))
 
     @property
     def trigger(self) -> str | None:
@@ -111,12 +113,15 @@ class DummyDMMBuffer(Buffer):
         self._device._force_trigger()
 
     def read_raw(self) -> dict:
-        data = {}
-
-        for parameter in self._subscribed_parameters:
-            index = self._device.buffer.subscribed_params.index(parameter)
-            data[parameter.name] = self._device.buffer.get()[index]
-            data[parameter.name] = data[parameter.name][self.delay_data_points : self.num_points]
+        # Get the buffer data once and pick the subscribed parameters from it
+        buffer = self._device.buffer
+        buffer_data = buffer.get()
+        subscribed_params = buffer.subscribed_params
+        start, stop = self.delay_data_points, self.num_points
+        data = {
+            parameter.name: buffer_data[subscribed_params.index(parameter)][start:stop]
+            for parameter in self._subscribed_parameters
+        }
         data["timestamps"] = np.linspace(0, self.num_points / self._device.buffer_SR(), self.num_points)
         return data
 
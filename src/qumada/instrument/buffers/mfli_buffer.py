@@ -23,7 +23,6 @@ from __future__ import annotations
 import logging
 
 import numpy as np
-from jsonschema import validate
 from qcodes.parameters import Parameter
 
 from qumada.instrument.buffers.buffer import Buffer, BufferException
@@ -70,7 +69,7 @@ class MFLIBuffer(Buffer):
 
     def setup_buffer(self, settings: dict) -> None:
         # validate settings
-        validate(settings, self.settings_schema)
+        self.validate_settings(settings)
         self.settings: dict = settings
         device = self._device
         self._daq.device(device)
@@ -159,44 +158,53 @@ class MFLIBuffer(Buffer):
         """
         # TODO: Include ._daq.repetitions (averages over multiple bursts)
 
-        if all(k in self.settings for k in ("sampling_rate", "burst_duration", "num_points")):
+        # Fetch each setting once. The settings are validated against settings_schema,
+        # so a None value means that the setting was not given.
+        settings = self.settings
+        sampling_rate = settings.get("sampling_rate")
+        duration = settings.get("duration")
+        burst_duration = settings.get("burst_duration")
+        num_bursts = settings.get("num_bursts")
+        num_points = settings.get("num_points")
+
+        if sampling_rate is not None and burst_duration is not None and num_points is not None:
             raise BufferException("You cannot define sampling_rate, burst_duration and num_points at the same time")
 
-        if all(k in self.settings for k in ("sampling_rate", "duration", "num_bursts", "num_points")):
+        if sampling_rate is not None and duration is not None and num_bursts is not None and num_points is not None:
             raise BufferException(
                 "You cannot define sampling rate, duration and num_burst and num_points at the same time"
             )
 
-        if all(k in self.settings for k in ("num_bursts", "duration", "burst_duration")):
+        if num_bursts is not None and duration is not None and burst_duration is not None:
             raise BufferException("You cannnot define duration, burst_duration and num_bursts at the same time")
 
-        if "burst_duration" in self.settings:
-            self._burst_duration = self.settings["burst_duration"]
+        if burst_duration is not None:
+            self._burst_duration = burst_duration
 
-        if "duration" in self.settings:
-            if "burst_duration" in self.settings:
-                self._num_bursts = np.ceil(self.settings["duration"] / self._burst_duration)
-            elif "num_bursts" in self.settings:
-                self._num_bursts = int(self.settings["num_bursts"])
-                self._burst_duration = self.settings["duration"] / self._num_bursts
+        if duration is not None:
+            if burst_duration is not None:
+                self._num_bursts = np.ceil(duration / burst_duration)
+            elif num_bursts is not None:
+                self._num_bursts = int(num_bursts)
+                self._burst_duration = duration / self._num_bursts
             else:
                 logger.info(
                     "You have specified neither burst_duration nor num_bursts. \
                       Using duration as burst_duration!"
                 )
-                self._burst_duration = self.settings["duration"]
+                self._burst_duration = duration
 
-        if "num_points" in self.settings:
-            self.num_points = int(self.settings["num_points"])
-            if "sampling_rate" in self.settings:
-                self._burst_duration = float(self.num_points / self.settings["sampling_rate"])
+        if num_points is not None:
+            self.num_points = int(num_points)
+            if sampling_rate is not None:
+                self._burst_duration = self.num_points / sampling_rate
 
-        elif "sampling_rate" in self.settings:
-            self._sampling_rate = float(self.settings["sampling_rate"])
+        elif sampling_rate is not None:
+            self._sampling_rate = float(sampling_rate)
             if self._burst_duration is not None:
                 self.num_points = int(np.ceil(self._sampling_rate * self._burst_duration))
-            elif all(k in self.settings for k in ("duration", "num_bursts")):
-                self._burst_duration = float(self.settings["duration"] / self.settings["num_bursts"])
+            elif duration is not None and num_bursts is not None:
+                self._burst_duration = duration / num_bursts
 
         self._daq.count(self._num_bursts)
         self._daq.duration(self._burst_duration)
@@ -204,10 +212,12 @@ class MFLIBuffer(Buffer):
 
     def read(self) -> dict:
         data = self.read_raw()
+        # Look up the node keys by their string once instead of searching per parameter
+        keys = {str(key): key for key in data}
         result_dict = {}
         for parameter in self._subscribed_parameters:
             node = self._get_node_from_parameter(parameter)
-            key = next(key for key in data.keys() if str(key) == str(node))
+            key = keys[str(node)]
             result_dict[parameter.name] = data[key][0].value
             if "timestamps" not in result_dict:
                 result_dict["timestamps"] = data[key][0].time
@@ -225,12 +235,19 @@ class MFLIBuffer(Buffer):
                 self._daq.subscribe(node)
 
     def unsubscribe(self, parameters: list[Parameter]) -> None:
-        for parameter in parameters.copy():
-            node = self._get_node_from_parameter(parameter)
-            if node in self._sample_nodes:
-                self._sample_nodes.remove(node)
-                self._subscribed_parameters.remove(parameter)
+        # Rebuild the lists in one pass instead of removing the parameters one by one.
+        # The order of the remaining parameters is kept, as read() relies on it.
+        to_remove = set(parameters)
+        subscribed_parameters = []
+        sample_nodes = []
+        for parameter, node in zip(self._subscribed_parameters, self._sample_nodes):
+            if parameter in to_remove:
                 self._daq.unsubscribe(node)
+            else:
+                subscribed_parameters.append(parameter)
+                sample_nodes.append(node)
+        self._subscribed_parameters = subscribed_parameters
+        self._sample_nodes = sample_nodes
 
     def is_subscribed(self, parameter: Parameter) -> bool:
         return parameter in self._subscribed_parameters
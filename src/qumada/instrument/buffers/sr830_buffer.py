@@ -21,7 +21,6 @@
 from __future__ import annotations
 
 import numpy as np
-from jsonschema import validate
 from pyvisa import VisaIOError
 from qcodes.instrument_drivers.stanford_research.SR830 import SR830
 from qcodes.parameters import Parameter
@@ -49,7 +48,7 @@ class SR830Buffer(Buffer):
         # TODO: Trigger und SR abgleichen
         # TODO: Are there different trigger modes?
 
-        validate(settings, self.settings_schema)
+        self.validate_settings(settings)
         self.settings: dict = settings
         self._device.buffer_SR(settings.get("sampling_rate", 512))
         self._device.buffer_trig_mode("OFF")
@@ -88,16 +87,19 @@ class SR830Buffer(Buffer):
         -------
         None
         """
-        if all(k in self.settings for k in ("sampling_rate", "burst_duration", "num_points")):
+        sampling_rate = self.settings.get("sampling_rate")
+        burst_duration = self.settings.get("burst_duration")
+        num_points = self.settings.get("num_points")
+        if sampling_rate is not None and burst_duration is not None and num_points is not None:
             raise BufferException("You cannot define sampling_rate, burst_duration and num_points at the same time")
-        elif self.settings.get("num_points", False):
-            self.num_points = self.settings["num_points"]
-            if self.settings.get("sampling_rate", False):
-                self._device.buffer_SR(self.settings["sampling_rate"])
+        elif num_points:
+            self.num_points = num_points
+            if sampling_rate:
+                self._device.buffer_SR(sampling_rate)
             else:
                 self._device.buffer_SR(self.num_points / self.settings["burst_duration"])
-        elif all(k in self.settings for k in ("sampling_rate", "burst_duration")):
-            self.num_points = int(np.ceil(self.settings["sampling_rate"] * self.settings["burst_duration"]))
+        elif sampling_rate is not None and burst_duration is not None:
+            self.num_points = int(np.ceil(sampling_rate * burst_duration))
 
     @property
     def trigger(self) -> str | None:
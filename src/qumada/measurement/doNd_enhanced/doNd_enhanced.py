@@ -31,10 +31,8 @@ import time
 import warnings
 from collections.abc import Sequence
 from functools import partial
-from typing import Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
-import matplotlib.axes
-import matplotlib.colorbar
 import numpy as np
 from qcodes import config
 from qcodes.dataset.data_set_protocol import DataSetProtocol
@@ -61,22 +59,27 @@ from qcodes.dataset.threading import (  # SequentialParamsCaller,; ThreadPoolPar
 from qcodes.parameters import ParameterBase
 from tqdm.auto import tqdm
 
+if TYPE_CHECKING:
+    # matplotlib is only needed for the annotations, importing it is slow
+    import matplotlib.axes
+    import matplotlib.colorbar
+
 ActionsT = Sequence[Callable[[], None]]
 BreakConditionT = Callable[[], bool]
 
 ParamMeasT = Union[ParameterBase, Callable[[], None]]
 
-AxesTuple = tuple[matplotlib.axes.Axes, matplotlib.colorbar.Colorbar]
-AxesTupleList = tuple[list[matplotlib.axes.Axes], list[Optional[matplotlib.colorbar.Colorbar]]]
+AxesTuple = tuple["matplotlib.axes.Axes", "matplotlib.colorbar.Colorbar"]
+AxesTupleList = tuple[list["matplotlib.axes.Axes"], list[Optional["matplotlib.colorbar.Colorbar"]]]
 AxesTupleListWithDataSet = tuple[
     DataSetProtocol,
-    list[matplotlib.axes.Axes],
-    list[Optional[matplotlib.colorbar.Colorbar]],
+    list["matplotlib.axes.Axes"],
+    list[Optional["matplotlib.colorbar.Colorbar"]],
 ]
 MultiAxesTupleListWithDataSet = tuple[
     tuple[DataSetProtocol, ...],
-    tuple[list[matplotlib.axes.Axes], ...],
-    tuple[list[Optional[matplotlib.colorbar.Colorbar]], ...],
+    tuple[list["matplotlib.axes.Axes"], ...],
+    tuple[list[Optional["matplotlib.colorbar.Colorbar"]], ...],
 ]
 
 LOG = logging.getLogger(__name__)
@@ -428,37 +431,30 @@ def _interpret_breaks(break_conditions: list, **kwargs) -> Callable[[], bool] |
 
     """
 
-    def eval_binary_expr(op1: Any, oper: str, op2: Any) -> bool:
-        # evaluates the string "op1 [operator] op2
-        # supports <, > and == as operators
-        ops = {
-            ">": operator.gt,
-            "<": operator.lt,
-            "==": operator.eq,
-        }
-        # Why convert explicitly to float?
-        # op1, op2 = float(op1), float(op2)
-        return ops[oper](op1, op2)
-
-    def f(cond, ops):
-        return partial(eval_binary_expr, cond["channel"].get_latest(), ops[1], float(ops[2]))()
+    # supports <, > and == as operators
+    comparators = {
+        ">": operator.gt,
+        "<": operator.lt,
+        "==": operator.eq,
+    }
 
-    def check_conditions(conditions: list[Callable[[], bool]]):
-        for cond in conditions:
-            if f(cond[0], cond[1]):
+    def check_conditions(conditions: list[tuple[Any, Callable[[Any, float], bool], float]]):
+        for channel, compare, value in conditions:
+            if compare(channel.get_latest(), value):
                 return True
         return False
 
     conditions = []
 
-    # Create break condition callables
+    # Create break condition callables. Comparator and threshold are parsed
+    # once here instead of on every check during the sweep.
     for cond in break_conditions:
         ops = cond["break_condition"].split(" ")
         if ops[0] != "val":
             raise NotImplementedError(
                 'Only parameter values can be used for breaks in this version. Use "val" for the break condition.'
             )
-        conditions.append([cond, ops])
+        conditions.append((cond["channel"], comparators[ops[1]], float(ops[2])))
 
     return partial(check_conditions, conditions) if conditions else None
 
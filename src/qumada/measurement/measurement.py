@@ -32,6 +32,7 @@ from collections.abc import MutableSequence
 from contextlib import suppress
 from datetime import datetime
 from functools import wraps
+from time import monotonic, sleep
 from typing import Any, Callable
 
 import numpy as np
@@ -79,17 +80,19 @@ def create_hook(func, hook):
     The hook function can use keyword-only arguments, which are omitted prior to execution of the main function.
     """
 
+    # The signature of the hook does not change, so it is inspected only once
+    sig = inspect.signature(hook)
+    varkw = next(
+        filter(
+            lambda p: p.kind is inspect.Parameter.VAR_KEYWORD,
+            sig.parameters.values(),
+        )
+    ).name
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         hook(*args, **kwargs)
         # remove arguments used in hook from kwargs
-        sig = inspect.signature(hook)
-        varkw = next(
-            filter(
-                lambda p: p.kind is inspect.Parameter.VAR_KEYWORD,
-                sig.parameters.values(),
-            )
-        ).name
         unused_kwargs = sig.bind(*args, **kwargs).arguments.get(varkw) or {}
         return func(*args, **unused_kwargs)
 
@@ -465,7 +468,9 @@ class MeasurementScript(ABC):
                 except KeyError:
                     pass
 
-    def initialize(self, dyn_ramp_to_val=False, inactive_dyn_channels: list | None = None) -> None:
+    def initialize(
+        self, dyn_ramp_to_val=False, inactive_dyn_channels: list | None = None, set_static: bool = True
+    ) -> None:
         """
         Sets all static/sweepable parameters to their value/start value.
         If parameters are both, static and dynamic, they will be set to the "value" property
@@ -483,6 +488,9 @@ class MeasurementScript(ABC):
             inactive_dyn_channels: List|None [None]: List of dynamic channels that are to be
                     treated as static for this initialization. They are always
                     ramped to their value instead of their sweeps starting point.
+            set_static: Bool [True]: If False, static parameters are not touched.
+                    Useful if they were already set by a previous initialization
+                    within the same measurement.
         """
         # TODO: Is there a more elegant way?
         # TODO: Put Sweep-Generation somewhere else?
@@ -502,13 +510,14 @@ class MeasurementScript(ABC):
         for gate, parameters in self.gate_parameters.items():
             for parameter, channel in parameters.items():
                 if self.properties[gate][parameter]["type"].find("static") >= 0:
-                    ramp_or_set_parameter(
-                        channel,
-                        self.properties[gate][parameter]["value"],
-                        ramp_rate=ramp_rate,
-                        ramp_time=ramp_time,
-                        setpoint_intervall=setpoint_intervall,
-                    )
+                    if set_static:
+                        ramp_or_set_parameter(
+                            channel,
+                            self.properties[gate][parameter]["value"],
+                            ramp_rate=ramp_rate,
+                            ramp_time=ramp_time,
+                            setpoint_intervall=setpoint_intervall,
+                        )
                 elif self.properties[gate][parameter]["type"].find("dynamic") >= 0:
                     if self.properties[gate][parameter].get("_is_triggered", False) and self.buffered:
                         if "num_points" in self.properties[gate][parameter].keys():
@@ -730,11 +739,19 @@ class MeasurementScript(ABC):
                         raise e
 
         if self.buffered:
-            for gettable_param in list(set(self.gettable_channels) - set(self.static_gettable_channels)):
+            static_gettable_channels = set(self.static_gettable_channels)
+            # Subscribe all parameters of a buffer with one call
+            buffer_parameters: dict = {}
+            for gettable_param in dict.fromkeys(self.gettable_channels):
+                if gettable_param in static_gettable_channels:
+                    continue
                 if is_bufferable(gettable_param):
-                    gettable_param.root_instrument._qumada_buffer.subscribe([gettable_param])
+                    buffer = gettable_param.root_instrument._qumada_buffer
+                    buffer_parameters.setdefault(buffer, []).append(gettable_param)
                 else:
                     raise Exception(f"{gettable_param} is not bufferable.")
+            for buffer, parameters in buffer_parameters.items():
+                buffer.subscribe(parameters)
 
     @abstractmethod
     def run(self) -> list:
@@ -816,6 +833,31 @@ class MeasurementScript(ABC):
         for trigger in self.trigger_ins:
             trigger.setup_trigger_in(trigger_settings=self.buffer_settings)
 
+    def wait_for_buffers(self, timeout: float | None = None, max_poll_interval: float = 0.1) -> None:
+        """
+        Block until all buffers registered in the measurement are finished.
+
+        Polling starts with a short interval that is doubled after every poll
+        up to max_poll_interval, so short acquisitions are read out without
+        waiting for a full polling period.
+
+        Args:
+            timeout (float | None): Maximum time in seconds to wait. Waits
+                indefinitely if None. Defaults to None.
+            max_poll_interval (float): Upper limit for the time between two
+                polls in seconds. Defaults to 0.1.
+
+        Raises:
+            TimeoutError: If the buffers are not finished after timeout.
+        """
+        poll_interval = min(0.001, max_poll_interval)
+        deadline = None if timeout is None else monotonic() + timeout
+        while not all(buffer.is_finished() for buffer in self.buffers):
+            if deadline is not None and monotonic() >= deadline:
+                raise TimeoutError("Buffers did not finish in time.")
+            sleep(poll_interval)
+            poll_interval = min(2 * poll_interval, max_poll_interval)
+
     def readout_buffers(self, **kwargs) -> dict:
         """
         Readout all buffer and return the results as list of tuples
@@ -840,7 +882,7 @@ class MeasurementScript(ABC):
             for param in buffer._subscribed_parameters:
                 results.append((param, flatten_array(data[buffer][param.name])))
         if kwargs.get("timestamps", False):
-            results.append(flatten_array(data[list(data.keys())[0]]["timestamps"]))
+            results.append(flatten_array(next(iter(data.values()))["timestamps"]))
         return results
 
     def _relabel_instruments(self) -> None:
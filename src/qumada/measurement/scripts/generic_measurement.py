@@ -22,12 +22,17 @@
 # - Sionludi Lab
 # - Tobias Hangleiter
 
+from __future__ import annotations
+
 import logging
-from time import sleep, time
+from itertools import chain
+from time import perf_counter, sleep, time
+from typing import Callable
 
 import numpy as np
 from qcodes.dataset import dond
 from qcodes.dataset.measurements import Measurement
+from qcodes.dataset.threading import SequentialParamsCaller, ThreadPoolParamsCaller
 from qcodes.parameters.specialized_parameters import ElapsedTimeParameter
 
 from qumada.instrument.buffers import is_bufferable
@@ -41,6 +46,23 @@ from qumada.utils.utils import _validate_mapping, naming_helper
 
 logger = logging.getLogger(__name__)
 
+# Default settling time (in s) after initialization of the unbuffered sweeps
+_DEFAULT_WAIT_TIME = 5
+
+
+def _resolve_trigger_reset(
+    trigger_reset: Callable[[], None] | None, message: str = "No method to reset the trigger defined."
+) -> Callable[[], None]:
+    """
+    Returns trigger_reset if it is callable. Otherwise the message is logged
+    once and a function doing nothing is returned, so that the scripts can
+    reset the trigger unconditionally.
+    """
+    if callable(trigger_reset):
+        return trigger_reset
+    logger.info(message)
+    return lambda: None
+
 
 class Generic_1D_Sweep(MeasurementScript):
     def run(self, **dond_kwargs) -> list:
@@ -59,6 +81,8 @@ class Generic_1D_Sweep(MeasurementScript):
         -------------------------
         wait_time : float, optional
             Wait time (in seconds) between initialization and each measurement.
+            Ramps during initialization are blocking, so this is only an
+            additional settling time and can be set to 0 if not needed.
             Default is 5.
         include_gate_name : bool, optional
             If True, append the name of the ramped gate to the measurement name.
@@ -72,38 +96,48 @@ class Generic_1D_Sweep(MeasurementScript):
         log_idle_params : bool, optional
             If True, record dynamic parameters kept constant during sweeps.
             Default is True.
+        reinit_between_sweeps : bool, optional
+            If False, static parameters are only set before the first sweep.
+            Default is True.
+        use_threads : bool, optional
+            If True, gettable parameters of different instruments are read in
+            parallel threads. Default is True.
 
         Returns
         -------
         list
             A list of QCoDeS datasets for each sweep.
         """
-        wait_time = self.settings.get("wait_time", 5)
+        wait_time = self.settings.get("wait_time", _DEFAULT_WAIT_TIME)
         include_gate_name = self.settings.get("include_gate_name", True)
+        reinit_between_sweeps = self.settings.get("reinit_between_sweeps", True)
+        dond_kwargs.setdefault("use_threads", self.settings.get("use_threads", True))
         naming_helper(self, default_name="1D Sweep")
-        data = list()
         self.generate_lists()
-        for sweep, dynamic_parameter in zip(self.dynamic_sweeps, self.dynamic_parameters):
+        break_condition = _interpret_breaks(self.break_conditions)
+        data = [None] * len(self.dynamic_sweeps)
+        for i, (sweep, dynamic_parameter) in enumerate(zip(self.dynamic_sweeps, self.dynamic_parameters)):
             if include_gate_name:
                 self._measurement_name = f"{self.measurement_name} {dynamic_parameter['gate']}"
             else:
                 self._measurement_name = self.measurement_name
+            inactive_channels = [chan for chan in self.dynamic_channels if chan != sweep.param]
+            # dict.fromkeys removes duplicates but keeps the column order stable
             if self.settings.get("log_idle_params", True):
-                idle_channels = [entry for entry in self.dynamic_channels if entry != sweep.param]
-                measured_channels = {*self.gettable_channels, *idle_channels}
+                measured_channels = list(dict.fromkeys(chain(self.gettable_channels, inactive_channels)))
             else:
-                measured_channels = set(self.gettable_channels)
-            inactive_channels = [chan for chan in self.dynamic_channels if chan != sweep.param]
-            self.initialize(inactive_dyn_channels=inactive_channels)
+                measured_channels = list(dict.fromkeys(self.gettable_channels))
+            self.initialize(
+                inactive_dyn_channels=inactive_channels,
+                set_static=(i == 0 or reinit_between_sweeps),
+            )
             sleep(wait_time)
-            data.append(
-                dond(
-                    sweep,
-                    *measured_channels,
-                    measurement_name=self._measurement_name,
-                    break_condition=_interpret_breaks(self.break_conditions),
-                    **dond_kwargs,
-                )
+            data[i] = dond(
+                sweep,
+                *measured_channels,
+                measurement_name=self._measurement_name,
+                break_condition=break_condition,
+                **dond_kwargs,
             )
         self.clean_up()
         return data
@@ -123,6 +157,8 @@ class Generic_nD_Sweep(MeasurementScript):
         -------------------------
         wait_time : float, optional
             Wait time (in seconds) between initialization and each measurement.
+            Ramps during initialization are blocking, so this is only an
+            additional settling time and can be set to 0 if not needed.
             Default is 5.
         include_gate_name : bool, optional
             If True, append the names of the ramped gates to the measurement name.
@@ -133,6 +169,9 @@ class Generic_nD_Sweep(MeasurementScript):
         ramp_time : float, optional
             Maximum time (in seconds) allowed for ramping each parameter during
             initialization. Default is 10.
+        use_threads : bool, optional
+            If True, gettable parameters of different instruments are read in
+            parallel threads. Default is True.
 
         Returns
         -------
@@ -141,8 +180,9 @@ class Generic_nD_Sweep(MeasurementScript):
         """
         self.buffered = False
         self.initialize()
-        wait_time = self.settings.get("wait_time", 5)
+        wait_time = self.settings.get("wait_time", _DEFAULT_WAIT_TIME)
         include_gate_name = self.settings.get("include_gate_name", True)
+        dond_kwargs.setdefault("use_threads", self.settings.get("use_threads", True))
         naming_helper(self, default_name="nD Sweep")
         if include_gate_name:
             measurement_name = f"{self.measurement_name} {[gate['gate'] for gate in self.dynamic_parameters]}"
@@ -156,11 +196,10 @@ class Generic_nD_Sweep(MeasurementScript):
             ramp_or_set_parameter(sweep._param, sweep.get_setpoints()[0])
         sleep(wait_time)
         data = dond(
-            *tuple(self.dynamic_sweeps),
-            *tuple(self.gettable_channels),
+            *self.dynamic_sweeps,
+            *self.gettable_channels,
             measurement_name=measurement_name,
             break_condition=_interpret_breaks(self.break_conditions),
-            use_threads=True,
             **dond_kwargs,
         )
         self.clean_up()
@@ -190,7 +229,9 @@ class Generic_1D_parallel_Sweep(MeasurementScript):
         Additional keyword arguments:
         - `backsweep_after_break` (bool): Sweeps backwards after a break condition
           is triggered. Default is `False`.
-        - `wait_time` (float): Wait time in seconds before starting the sweep. Default is `5`.
+        - `wait_time` (float): Settling time in seconds after the (blocking) initial ramps,
+          before starting the sweep. Default is `5`.
+        - `use_threads` (bool): Reads gettables of different instruments in parallel threads. Default is `True`.
 
     Returns
     -------
@@ -202,14 +243,12 @@ class Generic_1D_parallel_Sweep(MeasurementScript):
         naming_helper(self, default_name="Parallel 1D Sweep")
         self.initialize()
         backsweep_after_break = self.settings.get("backsweep_after_break", False)
-        wait_time = self.settings.get("wait_time", 5)
-        dynamic_params = list()
-        for sweep in self.dynamic_sweeps:
-            dynamic_params.append(sweep.param)
+        wait_time = self.settings.get("wait_time", _DEFAULT_WAIT_TIME)
+        do1d_kwargs.setdefault("use_threads", self.settings.get("use_threads", True))
         sleep(wait_time)
         data = do1d_parallel_asym(
-            *tuple(self.gettable_channels),
-            param_set=dynamic_params,
+            *self.gettable_channels,
+            param_set=self.dynamic_channels,
             setpoints=[sweep.get_setpoints() for sweep in self.dynamic_sweeps],
             delay=self.dynamic_sweeps[0]._delay,
             measurement_name=self.measurement_name,
@@ -225,9 +264,11 @@ class Timetrace(MeasurementScript):
     """
     Timetrace measurement.
 
-    Records data over a specified duration with a given timestep. Note that
-    the actual timesteps can vary as the recording time for each datapoint
-    is not constant. However, the elapsed time recorded is accurate.
+    Records data over a specified duration with a given timestep. The time
+    needed to record a datapoint is subtracted from the following wait, so
+    the datapoints are taken on a fixed schedule. If recording takes longer
+    than the timestep, the datapoints are taken back to back and a warning is
+    logged. The elapsed time recorded is accurate in any case.
 
     Parameters
     ----------
@@ -236,6 +277,12 @@ class Timetrace(MeasurementScript):
         - `duration` (float): Duration of the measurement in seconds. Default is `300`.
         - `timestep` (float): Time interval between measurements in seconds. Default is `1`.
         - `auto_naming` (bool): If `True`, renames the measurement automatically to "Timetrace". Default is `False`.
+        - `use_threads` (bool): If `True`, channels of different instruments are read in parallel threads.
+          Default is `True`.
+        - `write_period` (float): Time in seconds between two flushes of the collected results to the
+          database. Default is `None` (QCoDeS default).
+        - `write_in_background` (bool): If `True`, results are written to the database in a separate thread,
+          so that reading the channels does not wait for the database. Default is `None` (QCoDeS default).
 
     Returns
     -------
@@ -247,24 +294,45 @@ class Timetrace(MeasurementScript):
         self.initialize(dyn_ramp_to_val=True)
         duration = self.settings.get("duration", 300)
         timestep = self.settings.get("timestep", 1)
+        params_caller = ThreadPoolParamsCaller if self.settings.get("use_threads", True) else SequentialParamsCaller
         timer = ElapsedTimeParameter("time")
         naming_helper(self, default_name="Timetrace")
         meas = Measurement(name=self.measurement_name)
+        if self.settings.get("write_period") is not None:
+            meas.write_period = self.settings["write_period"]
         meas.register_parameter(timer)
-        for parameter in [*self.gettable_channels, *self.dynamic_channels]:
+        channels = [*self.gettable_channels, *self.dynamic_channels]
+        for parameter in channels:
             meas.register_parameter(
                 parameter,
                 setpoints=[
                     timer,
                 ],
             )
-        with meas.run() as datasaver:
-            timer.reset_clock()
-            while timer() < duration:
-                now = timer()
-                results = [(channel, channel.get()) for channel in [*self.gettable_channels, *self.dynamic_channels]]
-                datasaver.add_result((timer, now), *results)
-                sleep(timestep)
+        runner = meas.run(write_in_background=self.settings.get("write_in_background"))
+        with runner as datasaver, params_caller(*channels) as call_channels:
+            # The elapsed time is computed from the same clock the timer
+            # parameter uses, which saves the parameter overhead per sample.
+            # Bound methods are looked up once to keep the loop body short.
+            add_result = datasaver.add_result
+            next_time = 0
+            falling_behind = False
+            start = perf_counter()
+            while True:
+                now = perf_counter() - start
+                if now >= duration:
+                    break
+                add_result((timer, now), *call_channels())
+                next_time += timestep
+                remaining = next_time - (perf_counter() - start)
+                if remaining > 0:
+                    sleep(remaining)
+                elif next_time + timestep < perf_counter() - start:
+                    # Do not try to catch up on missed datapoints
+                    if not falling_behind:
+                        logger.warning("Recording a datapoint takes longer than the timestep.")
+                        falling_behind = True
+                    next_time = perf_counter() - start
         dataset = datasaver.dataset
         self.clean_up()
         return dataset
@@ -320,7 +388,7 @@ class Timetrace_buffered(MeasurementScript):
         timer = ElapsedTimeParameter("time")
         TRIGGER_TYPES = ["software", "hardware"]
         trigger_start = self.settings.get("trigger_start", "software")  # TODO: this should be set elsewhere
-        trigger_reset = self.settings.get("trigger_reset", None)
+        trigger_reset = _resolve_trigger_reset(self.settings.get("trigger_reset", None))
         trigger_type = _validate_mapping(
             self.settings.get("trigger_type"),
             TRIGGER_TYPES,
@@ -343,29 +411,19 @@ class Timetrace_buffered(MeasurementScript):
                 ],
             )
         # Block required to log gettable and static parameters that are not
-        # buffarable (e.g. Dac Channels)
+        # buffarable (e.g. Dac Channels). All of them are already registered
+        # above, so they only have to be sorted here.
         static_gettables = []
         del_channels = []
         del_params = []
         for parameter, channel in zip(self.gettable_parameters, self.gettable_channels):
             if is_bufferable(channel):
-                meas.register_parameter(
-                    channel,
-                    setpoints=[
-                        timer,
-                    ],
-                )
+                continue
             elif channel in self.static_channels:
                 del_channels.append(channel)
                 del_params.append(parameter)
-                meas.register_parameter(
-                    channel,
-                    setpoints=[
-                        timer,
-                    ],
-                )
                 parameter_value = self.properties[parameter["gate"]][parameter["parameter"]]["value"]
-                static_gettables.append((channel, [parameter_value for _ in range(int(self.buffered_num_points))]))
+                static_gettables.append((channel, [parameter_value] * int(self.buffered_num_points)))
             else:
                 raise Exception(f"{channel} cannot be buffered and is not static gettable")
         for channel in del_channels:
@@ -374,7 +432,7 @@ class Timetrace_buffered(MeasurementScript):
             self.gettable_parameters.remove(param)
         for parameter, channel in zip(self.dynamic_parameters, self.dynamic_channels):
             parameter_value = self.properties[parameter["gate"]][parameter["parameter"]]["value"]
-            static_gettables.append((channel, [parameter_value for _ in range(int(self.buffered_num_points))]))
+            static_gettables.append((channel, [parameter_value] * int(self.buffered_num_points)))
         with meas.run() as datasaver:
             # start = timer.reset_clock()
             self.ready_buffers()
@@ -385,20 +443,15 @@ class Timetrace_buffered(MeasurementScript):
                 # Set trigger to high here
                 try:
                     trigger_start()
-                except Exception:
-                    print("Please set a trigger or define a trigger_start method")
-                pass
+                except TypeError:
+                    logger.warning("Please set a trigger or define a trigger_start method")
 
             elif trigger_type == "software":
                 for buffer in self.buffers:
                     buffer.force_trigger()
 
-            while not all(buffer.is_finished() for buffer in list(self.buffers)):
-                sleep(0.1)
-            try:
-                trigger_reset()
-            except Exception:
-                print("No method to reset the trigger defined.")
+            self.wait_for_buffers()
+            trigger_reset()
 
             results = self.readout_buffers(timestamps=True)
             # TODO: Append values from other dynamic parameters
@@ -426,6 +479,16 @@ class Timetrace_with_sweeps(MeasurementScript):
         Total duration of the measurement in seconds. Default is 300.
     timestep : int, optional
         Time between sweeps in seconds. Default is 1.
+    use_threads : bool, optional
+        If True, gettables of different instruments are read in parallel
+        threads. Default is True.
+    write_period : float, optional
+        Time in seconds between two flushes of the collected results to the
+        database. Default is None (QCoDeS default).
+    write_in_background : bool, optional
+        If True, results are written to the database in a separate thread,
+        so that the sweeps do not wait for the database. Default is None
+        (QCoDeS default).
 
     Returns
     -------
@@ -435,6 +498,9 @@ class Timetrace_with_sweeps(MeasurementScript):
     Notes
     -----
     - Dynamic sweeps are executed at each timestep during the measurement.
+    - Every setpoint is set and read from Python. If the dynamic parameters
+      support ramps and the gettables can be buffered, use
+      Timetrace_with_Sweeps_buffered, which lets the instruments run the sweep.
 
     """
 
@@ -442,9 +508,13 @@ class Timetrace_with_sweeps(MeasurementScript):
         self.initialize()
         duration = self.settings.get("duration", 300)
         timestep = self.settings.get("timestep", 1)
+        params_caller = ThreadPoolParamsCaller if self.settings.get("use_threads", True) else SequentialParamsCaller
         # backsweeps = self.settings.get("backsweeps", False)
         timer = ElapsedTimeParameter("time")
-        meas = Measurement(name=self.metadata.measurement.name or "timetrace")
+        naming_helper(self, default_name="Timetrace with sweeps")
+        meas = Measurement(name=self.measurement_name)
+        if self.settings.get("write_period") is not None:
+            meas.write_period = self.settings["write_period"]
         meas.register_parameter(timer)
         setpoints = [timer]
         for parameter in self.dynamic_channels:
@@ -452,18 +522,21 @@ class Timetrace_with_sweeps(MeasurementScript):
             setpoints.append(parameter)
         for parameter in self.gettable_channels:
             meas.register_parameter(parameter, setpoints=setpoints)
-        with meas.run() as datasaver:
-            timer.reset_clock()
-            while timer() < duration:
-                for sweep in self.dynamic_sweeps:
-                    ramp_or_set_parameter(sweep._param, sweep.get_setpoints()[0], ramp_time=timestep)
-                now = timer()
-                for i in range(0, len(self.dynamic_sweeps[0].get_setpoints())):
-                    for sweep in self.dynamic_sweeps:
-                        sweep._param.set(sweep.get_setpoints()[i])
-                    set_values = [(sweep._param, sweep.get_setpoints()[i]) for sweep in self.dynamic_sweeps]
-                    results = [(channel, channel.get()) for channel in self.gettable_channels]
-                    datasaver.add_result((timer, now), *set_values, *results)
+        sweep_params = [sweep.param for sweep in self.dynamic_sweeps]
+        sweep_setpoints = [sweep.get_setpoints() for sweep in self.dynamic_sweeps]
+        sweep_setters = [param.set for param in sweep_params]
+        runner = meas.run(write_in_background=self.settings.get("write_in_background"))
+        with runner as datasaver, params_caller(*self.gettable_channels) as call_gettables:
+            add_result = datasaver.add_result
+            start = perf_counter()
+            while perf_counter() - start < duration:
+                for param, setpoints in zip(sweep_params, sweep_setpoints):
+                    ramp_or_set_parameter(param, setpoints[0], ramp_time=timestep)
+                now = perf_counter() - start
+                for values in zip(*sweep_setpoints):
+                    for set_value, value in zip(sweep_setters, values):
+                        set_value(value)
+                    add_result((timer, now), *zip(sweep_params, values), *call_gettables())
                 # sleep(timestep)
         dataset = datasaver.dataset
         self.clean_up()
@@ -500,8 +573,6 @@ class Timetrace_with_Sweeps_buffered(MeasurementScript):
     ------
     AttributeError
         If the required methods for triggering or ramping are not defined.
-    TypeError
-        If no reset method for the trigger is defined.
 
     Notes
     -----
@@ -515,7 +586,7 @@ class Timetrace_with_Sweeps_buffered(MeasurementScript):
         timer = ElapsedTimeParameter("time")
         TRIGGER_TYPES = ["software", "hardware", "manual"]
         trigger_start = self.settings.get("trigger_start", "software")  # TODO: this should be set elsewhere
-        trigger_reset = self.settings.get("trigger_reset", None)
+        trigger_reset = _resolve_trigger_reset(self.settings.get("trigger_reset", None))
         sync_trigger = self.settings.get("sync_trigger", None)
         trigger_type = _validate_mapping(
             self.settings.get("trigger_type"),
@@ -544,13 +615,16 @@ class Timetrace_with_Sweeps_buffered(MeasurementScript):
             elif channel in self.static_gettable_channels:
                 meas.register_parameter(channel, setpoints=[timer, *self.dynamic_channels])
                 parameter_value = self.properties[parameter["gate"]][parameter["parameter"]]["value"]
-                static_gettables.append((channel, [parameter_value for _ in range(int(self.buffered_num_points))]))
+                static_gettables.append((channel, [parameter_value] * int(self.buffered_num_points)))
+        # The sweeps are the same for every timestep
+        dynamic_param_results = [
+            (dyn_channel, sweep.get_setpoints())
+            for dyn_channel, sweep in zip(self.dynamic_channels, self.dynamic_sweeps)
+        ]
+        end_values = [setpoints[-1] for _, setpoints in dynamic_param_results]
         start = time()
         with meas.run() as datasaver:
-            try:
-                trigger_reset()
-            except TypeError:
-                logger.info("No method to reset the trigger defined.")
+            trigger_reset()
             while time() - start < duration:
                 self.initialize()
                 self.ready_buffers()
@@ -558,7 +632,7 @@ class Timetrace_with_Sweeps_buffered(MeasurementScript):
                 try:
                     self.dynamic_channels[0].root_instrument._qumada_ramp(
                         self.dynamic_channels,
-                        end_values=[sweep.get_setpoints()[-1] for sweep in self.dynamic_sweeps],
+                        end_values=end_values,
                         ramp_time=self._burst_duration,
                         sync_trigger=sync_trigger,
                     )
@@ -589,17 +663,9 @@ class Timetrace_with_Sweeps_buffered(MeasurementScript):
                         measurement instruments! Only recommended\
                         for debugging."
                     )
-                while not all(buffer.is_finished() for buffer in list(self.buffers)):
-                    sleep(0.1)
-                try:
-                    trigger_reset()
-                except TypeError:
-                    logger.info("No method to reset the trigger defined.")
+                self.wait_for_buffers()
+                trigger_reset()
                 results = self.readout_buffers(timestamps=True)
-                dynamic_param_results = [
-                    (dyn_channel, sweep.get_setpoints())
-                    for dyn_channel, sweep in zip(self.dynamic_channels, self.dynamic_sweeps)
-                ]
                 results.pop(-1)  # removes timestamps from results
                 datasaver.add_result(
                     (timer, t),
@@ -634,6 +700,10 @@ class Generic_1D_Sweep_buffered(MeasurementScript):
         If True, appends the name of the ramped gates to the measurement name. Default is True.
     sync_trigger : int, optional
         Number of the used sync trigger (QDacs only). Default is None.
+    reinit_between_sweeps : bool, optional
+        If False, static parameters are only set before the first sweep and
+        subsequent sweeps only reinitialize the dynamic parameters.
+        Default is True.
 
     Returns
     -------
@@ -644,8 +714,6 @@ class Generic_1D_Sweep_buffered(MeasurementScript):
     ------
     AttributeError
         If a required method (e.g., for ramping) is missing.
-    TypeError
-        If no reset method for the trigger is defined.
     Exception
         If setpoints of a parameter exceed defined limits.
 
@@ -660,7 +728,7 @@ class Generic_1D_Sweep_buffered(MeasurementScript):
         self.buffered = True
         TRIGGER_TYPES = ["software", "hardware", "manual"]
         trigger_start = self.settings.get("trigger_start", "manual")  # TODO: this should be set elsewhere
-        trigger_reset = self.settings.get("trigger_reset", None)
+        trigger_reset = _resolve_trigger_reset(self.settings.get("trigger_reset", None))
         trigger_type = _validate_mapping(
             self.settings.get("trigger_type"),
             TRIGGER_TYPES,
@@ -669,8 +737,9 @@ class Generic_1D_Sweep_buffered(MeasurementScript):
         )
         include_gate_name = self.settings.get("include_gate_name", True)
         sync_trigger = self.settings.get("sync_trigger", None)
-        datasets = []
+        reinit_between_sweeps = self.settings.get("reinit_between_sweeps", True)
         self.generate_lists()
+        datasets = [None] * len(self.dynamic_sweeps)
         measurement_name = naming_helper(self, default_name="1D Sweep")
         # meas.register_parameter(timer)
 
@@ -681,11 +750,15 @@ class Generic_1D_Sweep_buffered(MeasurementScript):
             dynamic_parameter = self.dynamic_parameters[i]
             if include_gate_name:
                 self.measurement_name += f" {dynamic_parameter['gate']}"
-            self.properties[dynamic_parameter["gate"]][dynamic_parameter["parameter"]]["_is_triggered"] = True
+            dynamic_properties = self.properties[dynamic_parameter["gate"]][dynamic_parameter["parameter"]]
+            dynamic_properties["_is_triggered"] = True
 
             dynamic_param = self.dynamic_sweeps[i].param
             inactive_channels = [chan for chan in self.dynamic_channels if chan != dynamic_param]
-            self.initialize(inactive_dyn_channels=inactive_channels)
+            self.initialize(
+                inactive_dyn_channels=inactive_channels,
+                set_static=(i == 0 or reinit_between_sweeps),
+            )
             meas = Measurement(name=self.measurement_name)
             meas.register_parameter(dynamic_param)
             for c_param in self.active_compensating_channels:
@@ -707,7 +780,7 @@ class Generic_1D_Sweep_buffered(MeasurementScript):
                 elif channel in self.static_gettable_channels:
                     parameter_value = self.properties[parameter["gate"]][parameter["parameter"]]["value"]
                     parameter_value = channel.get()
-                    static_gettables.append((channel, [parameter_value for _ in range(int(self.buffered_num_points))]))
+                    static_gettables.append((channel, [parameter_value] * int(self.buffered_num_points)))
             for parameter, channel in zip(self.dynamic_parameters, self.dynamic_channels):
                 if channel != dynamic_param:
                     try:
@@ -718,7 +791,7 @@ class Generic_1D_Sweep_buffered(MeasurementScript):
                               and cannot be logged!"
                         )
                         break
-                    static_gettables.append((channel, [parameter_value for _ in range(int(self.buffered_num_points))]))
+                    static_gettables.append((channel, [parameter_value] * int(self.buffered_num_points)))
             for param in static_gettables:
                 meas.register_parameter(
                     param[0],
@@ -750,18 +823,17 @@ class Generic_1D_Sweep_buffered(MeasurementScript):
             with meas.run() as datasaver:
 
                 dynamic_sweep = self.dynamic_sweeps[i]
-                try:
-                    trigger_reset()
-                except TypeError:
-                    logger.info("No method to reset the trigger defined.")
+                dynamic_setpoints = dynamic_sweep.get_setpoints()
+                comping_setpoints = [sweep.get_setpoints() for sweep in active_comping_sweeps]
+                trigger_reset()
                 results = []
                 self.ready_buffers()
                 try:
                     dynamic_param.root_instrument._qumada_ramp(
                         [dynamic_param, *self.active_compensating_channels],
                         end_values=[
-                            dynamic_sweep.get_setpoints()[-1],
-                            *[sweep.get_setpoints()[-1] for sweep in active_comping_sweeps],
+                            dynamic_setpoints[-1],
+                            *[setpoints[-1] for setpoints in comping_setpoints],
                         ],
                         ramp_time=self._burst_duration,
                         sync_trigger=sync_trigger,
@@ -793,25 +865,19 @@ class Generic_1D_Sweep_buffered(MeasurementScript):
                         measurement instruments! Only recommended \
                         for debugging."
                     )
-                while not all(buffer.is_finished() for buffer in list(self.buffers)):
-                    sleep(0.1)
-                try:
-                    trigger_reset()
-                except TypeError:
-                    logger.info("No method to reset the trigger defined.")
+                self.wait_for_buffers()
+                trigger_reset()
 
                 results = self.readout_buffers()
-                comp_results = []
-                for ch, sw in zip(self.active_compensating_channels, active_comping_sweeps):
-                    comp_results.append((ch, sw.get_setpoints()))
+                comp_results = zip(self.active_compensating_channels, comping_setpoints)
                 datasaver.add_result(
-                    (dynamic_param, dynamic_sweep.get_setpoints()),
+                    (dynamic_param, dynamic_setpoints),
                     *comp_results,
                     *results,
                     *static_gettables,
                 )
-                datasets.append(datasaver.dataset)
-                self.properties[dynamic_parameter["gate"]][dynamic_parameter["parameter"]]["_is_triggered"] = False
+                datasets[i] = datasaver.dataset
+                dynamic_properties["_is_triggered"] = False
                 self.clean_up()
         return datasets
 
@@ -855,8 +921,6 @@ class Generic_1D_Hysteresis_buffered(MeasurementScript):
     ------
     AttributeError
         If a required method (e.g., for ramping) is missing.
-    TypeError
-        If no reset method for the trigger is defined.
     Exception
         If static or dynamic parameters have invalid configurations.
 
@@ -870,7 +934,7 @@ class Generic_1D_Hysteresis_buffered(MeasurementScript):
         self.buffered = True
         TRIGGER_TYPES = ["software", "hardware", "manual"]
         trigger_start = self.settings.get("trigger_start", "manual")  # TODO: this should be set elsewhere
-        trigger_reset = self.settings.get("trigger_reset", None)
+        trigger_reset = _resolve_trigger_reset(self.settings.get("trigger_reset", None))
         trigger_type = _validate_mapping(
             self.settings.get("trigger_type"),
             TRIGGER_TYPES,
@@ -881,15 +945,18 @@ class Generic_1D_Hysteresis_buffered(MeasurementScript):
         sync_trigger = self.settings.get("sync_trigger", None)
         iterations = self.settings.get("iterations", 1)
         iterations *= 2
-        datasets = []
         self.generate_lists()
+        datasets = [None] * len(self.dynamic_sweeps)
         measurement_name = naming_helper(self, default_name="1D Sweep")
         # meas.register_parameter(timer)
-        for dynamic_sweep, dynamic_parameter in zip(self.dynamic_sweeps.copy(), self.dynamic_parameters.copy()):
+        for i, (dynamic_sweep, dynamic_parameter) in enumerate(
+            zip(self.dynamic_sweeps.copy(), self.dynamic_parameters.copy())
+        ):
             self.measurement_name = measurement_name
             if include_gate_name:
                 self.measurement_name += f" {dynamic_parameter['gate']}"
-            self.properties[dynamic_parameter["gate"]][dynamic_parameter["parameter"]]["_is_triggered"] = True
+            dynamic_properties = self.properties[dynamic_parameter["gate"]][dynamic_parameter["parameter"]]
+            dynamic_properties["_is_triggered"] = True
             dynamic_param = dynamic_sweep.param
             meas = Measurement(name=self.measurement_name)
             meas.register_parameter(dynamic_param)
@@ -910,7 +977,7 @@ class Generic_1D_Hysteresis_buffered(MeasurementScript):
                     del_channels.append(channel)
                     del_params.append(parameter)
                     parameter_value = self.properties[parameter["gate"]][parameter["parameter"]]["value"]
-                    static_gettables.append((channel, [parameter_value for _ in range(int(self.buffered_num_points))]))
+                    static_gettables.append((channel, [parameter_value] * int(self.buffered_num_points)))
             for parameter, channel in zip(self.dynamic_parameters, self.dynamic_channels):
                 if channel != dynamic_param:
                     try:
@@ -921,7 +988,7 @@ class Generic_1D_Hysteresis_buffered(MeasurementScript):
                               and cannot be logged!"
                         )
                         break
-                    static_gettables.append((channel, [parameter_value for _ in range(int(self.buffered_num_points))]))
+                    static_gettables.append((channel, [parameter_value] * int(self.buffered_num_points)))
             for param in static_gettables:
                 meas.register_parameter(
                     param[0],
@@ -934,25 +1001,24 @@ class Generic_1D_Hysteresis_buffered(MeasurementScript):
             for param in del_params:
                 self.gettable_parameters.remove(param)
 
-            try:
-                trigger_reset()
-            except TypeError:
-                logger.info("No method to reset the trigger defined.")
+            trigger_reset()
 
             with meas.run() as datasaver:
                 inactive_channels = [chan for chan in self.dynamic_channels if chan != dynamic_param]
                 self.initialize(inactive_dyn_channels=inactive_channels)
                 results = []
+                # Fore- and backsweep setpoints are the same for every
+                # iteration, the backsweep is only a reversed view.
+                foresweep_setpoints = np.asarray(dynamic_sweep.get_setpoints())
+                backsweep_setpoints = foresweep_setpoints[::-1]
 
                 for iiter in range(0, iterations):
                     self.ready_buffers()
                     if iiter % 2 == 0:
-                        set_points = dynamic_sweep.get_setpoints()
-                        end_value = dynamic_sweep.get_setpoints()[-1]
-
+                        set_points = foresweep_setpoints
                     else:
-                        end_value = dynamic_sweep.get_setpoints()[0]
-                        set_points = list(reversed(dynamic_sweep.get_setpoints()))
+                        set_points = backsweep_setpoints
+                    end_value = set_points[-1]
                     try:
                         dynamic_param.root_instrument._qumada_ramp(
                             [dynamic_param],
@@ -988,12 +1054,8 @@ class Generic_1D_Hysteresis_buffered(MeasurementScript):
                                         measurement instruments! Only recommended\
                                         for debugging."
                         )
-                    while not all(buffer.is_finished() for buffer in list(self.buffers)):
-                        sleep(0.1)
-                    try:
-                        trigger_reset()
-                    except TypeError:
-                        logger.info("No method to reset the trigger defined.")
+                    self.wait_for_buffers()
+                    trigger_reset()
 
                     results = self.readout_buffers()
                     datasaver.add_result(
@@ -1001,8 +1063,8 @@ class Generic_1D_Hysteresis_buffered(MeasurementScript):
                         *results,
                         *static_gettables,
                     )
-                datasets.append(datasaver.dataset)
-                self.properties[dynamic_parameter["gate"]][dynamic_parameter["parameter"]]["_is_triggered"] = False
+                datasets[i] = datasaver.dataset
+                dynamic_properties["_is_triggered"] = False
                 self.clean_up()
         return datasets
 
@@ -1061,7 +1123,11 @@ class Generic_2D_Sweep_buffered(MeasurementScript):
         self.buffered = True
         TRIGGER_TYPES = ["software", "hardware", "manual"]
         trigger_start = self.settings.get("trigger_start", "manual")  # TODO: this should be set elsewhere
-        trigger_reset = self.settings.get("trigger_reset", None)
+        trigger_reset = _resolve_trigger_reset(
+            self.settings.get("trigger_reset", None),
+            "No method to reset the trigger defined. "
+            "As you are doing a 2D Sweep, this can have undesired consequences!",
+        )
         trigger_type = _validate_mapping(
             self.settings.get("trigger_type"),
             TRIGGER_TYPES,
@@ -1133,7 +1199,7 @@ class Generic_2D_Sweep_buffered(MeasurementScript):
                     ],
                 )
                 parameter_value = self.properties[parameter["gate"]][parameter["parameter"]]["value"]
-                static_gettables.append((channel, [parameter_value for _ in range(int(self.buffered_num_points))]))
+                static_gettables.append((channel, [parameter_value] * int(self.buffered_num_points)))
         for channel in del_channels:
             self.gettable_channels.remove(channel)
         for param in del_params:
@@ -1149,21 +1215,17 @@ class Generic_2D_Sweep_buffered(MeasurementScript):
                     fast_channel,
                 ],
             )
-        try:
-            trigger_reset()
-        except TypeError:
-            logger.info("No method to reset the trigger defined.")
+        trigger_reset()
         with meas.run() as datasaver:
             results = []
             slow_setpoints = slow_sweep.get_setpoints()
+            fast_setpoints = fast_sweep.get_setpoints()
             for setpoint in slow_setpoints:
                 slow_channel.set(setpoint)
                 if reset_time > 0:
-                    ramp_or_set_parameter(
-                        fast_channel, fast_sweep.get_setpoints()[0], ramp_rate=None, ramp_time=reset_time
-                    )
+                    ramp_or_set_parameter(fast_channel, fast_setpoints[0], ramp_rate=None, ramp_time=reset_time)
                 else:
-                    fast_channel.set(fast_sweep.get_setpoints()[0])
+                    fast_channel.set(fast_setpoints[0])
                 if reset_time < slow_sweep._delay:
                     sleep(slow_sweep._delay - reset_time)
 
@@ -1172,13 +1234,13 @@ class Generic_2D_Sweep_buffered(MeasurementScript):
                 for j in range(len(self.active_compensating_channels)):
                     index = self.compensating_parameters.index(self.active_compensating_parameters[j])
                     active_comping_setpoints = np.array(
-                        [self.compensating_parameters_values[index] for _ in range(len(fast_sweep.get_setpoints()))],
+                        [self.compensating_parameters_values[index]] * len(fast_setpoints),
                         dtype=float,
                     )
                     try:
                         slow_index = self.compensated_parameters[j].index(slow_param)
                         active_comping_setpoints -= float(self.compensating_leverarms[j][slow_index]) * (
-                            float(setpoint) - float(slow_sweep.get_setpoints()[0])
+                            float(setpoint) - float(slow_setpoints[0])
                         )
                     except ValueError:
                         pass
@@ -1207,12 +1269,12 @@ class Generic_2D_Sweep_buffered(MeasurementScript):
                     fast_channel.root_instrument._qumada_ramp(
                         [fast_channel, *self.active_compensating_channels],
                         start_values=[
-                            fast_sweep.get_setpoints()[0],
-                            *[sweep.get_setpoints()[0] for sweep in active_comping_sweeps],
+                            fast_setpoints[0],
+                            *[setpoints[0] for _, setpoints in comping_results],
                         ],
                         end_values=[
-                            fast_sweep.get_setpoints()[-1],
-                            *[sweep.get_setpoints()[-1] for sweep in active_comping_sweeps],
+                            fast_setpoints[-1],
+                            *[setpoints[-1] for _, setpoints in comping_results],
                         ],
                         ramp_time=self._burst_duration,
                         sync_trigger=sync_trigger,
@@ -1245,25 +1307,13 @@ class Generic_2D_Sweep_buffered(MeasurementScript):
                         measurement instruments! Only recommended\
                         for debugging."
                     )
-                timer = 0
-                while not all(buffer.is_finished() for buffer in list(self.buffers)):
-                    timer += 0.1
-                    sleep(0.1)
-                    if timer >= buffer_timeout_multiplier * self._burst_duration:
-                        raise TimeoutError
-                try:
-                    trigger_reset()
-                except TypeError:
-                    logger.info(
-                        "No method to reset the trigger defined. \
-                        As you are doing a 2D Sweep, this can have undesired \
-                        consequences!"
-                    )
+                self.wait_for_buffers(timeout=buffer_timeout_multiplier * self._burst_duration)
+                trigger_reset()
 
                 results = self.readout_buffers()
                 datasaver.add_result(
                     (slow_channel, setpoint),
-                    (fast_channel, fast_sweep.get_setpoints()),
+                    (fast_channel, fast_setpoints),
                     *comping_results,
                     *results,
                     *static_gettables,
@@ -1322,7 +1372,7 @@ class Generic_Pulsed_Measurement(MeasurementScript):
         self.buffered = True
         TRIGGER_TYPES = ["software", "hardware", "manual"]
         trigger_start = self.settings.get("trigger_start", "manual")  # TODO: this should be set elsewhere
-        trigger_reset = self.settings.get("trigger_reset", None)
+        trigger_reset = _resolve_trigger_reset(self.settings.get("trigger_reset", None))
         trigger_type = _validate_mapping(
             self.settings.get("trigger_type"),
             TRIGGER_TYPES,
@@ -1374,7 +1424,7 @@ class Generic_Pulsed_Measurement(MeasurementScript):
                     ],
                 )
                 parameter_value = self.properties[parameter["gate"]][parameter["parameter"]]["value"]
-                static_gettables.append((channel, [parameter_value for _ in range(self.buffered_num_points)]))
+                static_gettables.append((channel, [parameter_value] * self.buffered_num_points))
         for channel in del_channels:
             self.gettable_channels.remove(channel)
         for param in del_params:
@@ -1403,10 +1453,7 @@ class Generic_Pulsed_Measurement(MeasurementScript):
                 self.compensating_limits[index]
             ):
                 raise Exception(f"Setpoints of compensating gate {self.compensating_parameters[index]} exceed limits!")
-        try:
-            trigger_reset()
-        except TypeError:
-            logger.info("No method to reset the trigger defined.")
+        trigger_reset()
         with meas.run() as datasaver:
             results = []
             self.ready_buffers()
@@ -1449,16 +1496,8 @@ class Generic_Pulsed_Measurement(MeasurementScript):
                     measurement instruments! Only recommended\
                     for debugging."
                 )
-            timeout_timer = 0
-            while not all(buffer.is_finished() for buffer in list(self.buffers)):
-                timeout_timer += 0.1
-                sleep(0.1)
-                if timeout_timer >= buffer_timeout_multiplier * self._burst_duration:
-                    raise TimeoutError
-            try:
-                trigger_reset()
-            except TypeError:
-                logger.info("No method to reset the trigger defined.")
+            self.wait_for_buffers(timeout=buffer_timeout_multiplier * self._burst_duration)
+            trigger_reset()
 
             results = self.readout_buffers()
 
@@ -1525,7 +1564,7 @@ class Generic_Pulsed_Repeated_Measurement(MeasurementScript):
         self.buffered = True
         TRIGGER_TYPES = ["software", "hardware", "manual"]
         trigger_start = self.settings.get("trigger_start", "manual")  # TODO: this should be set elsewhere
-        trigger_reset = self.settings.get("trigger_reset", None)
+        trigger_reset = _resolve_trigger_reset(self.settings.get("trigger_reset", None))
         trigger_type = _validate_mapping(
             self.settings.get("trigger_type"),
             TRIGGER_TYPES,
@@ -1577,7 +1616,7 @@ class Generic_Pulsed_Repeated_Measurement(MeasurementScript):
                     ],
                 )
                 parameter_value = self.properties[parameter["gate"]][parameter["parameter"]]["value"]
-                static_gettables.append((channel, [parameter_value for _ in range(self.buffered_num_points)]))
+                static_gettables.append((channel, [parameter_value] * self.buffered_num_points))
         for channel in del_channels:
             self.gettable_channels.remove(channel)
         for param in del_params:
@@ -1610,10 +1649,7 @@ class Generic_Pulsed_Repeated_Measurement(MeasurementScript):
         with meas.run() as datasaver:
             for k in range(self.repetitions):
                 self.initialize()
-                try:
-                    trigger_reset()
-                except TypeError:
-                    logger.info("No method to reset the trigger defined.")
+                trigger_reset()
                 self.ready_buffers()
                 for instr in instruments:
                     try:
@@ -1655,12 +1691,8 @@ class Generic_Pulsed_Repeated_Measurement(MeasurementScript):
                         for debugging."
                     )
 
-                while not all(buffer.is_finished() for buffer in list(self.buffers)):
-                    sleep(0.1)
-                try:
-                    trigger_reset()
-                except TypeError:
-                    logger.info("No method to reset the trigger defined.")
+                self.wait_for_buffers()
+                trigger_reset()
 
                 results.append(self.readout_buffers())
             average_results = []
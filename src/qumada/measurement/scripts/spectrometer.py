@@ -116,7 +116,7 @@ class Measure_Spectrum(MeasurementScript):
                 ],
             )
             parameter_value = self.properties[parameter["gate"]][parameter["parameter"]]["value"]
-            static_gettables.append((channel, [parameter_value for _ in range(len(x))]))
+            static_gettables.append((channel, [parameter_value] * len(x)))
 
         with measurement.run() as datasaver:
             datasaver.add_result(
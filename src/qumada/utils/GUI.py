@@ -36,17 +36,14 @@ def open_web_gui(parameters):
     When a station object is used, all parameters of all components are shown.
     """
     if isinstance(parameters, Station):
-        params = [val for val in filter_flatten_parameters(parameters.components).values()]
+        params = list(filter_flatten_parameters(parameters.components).values())
     elif isinstance(parameters, MeasurementScript):
-        params = []
         try:
-            channels = [val for val in parameters.gate_parameters.values()]
+            channels = parameters.gate_parameters.values()
         except Exception:
             print("Error not yet implemented. Maybe you forgot to do the mapping first?")
             return False
-        for gate in channels:
-            for item in gate.values():
-                params.append(item)
+        params = [item for gate in channels for item in gate.values()]
     elif isinstance(parameters, list):
         params = parameters
     else:
@@ -56,6 +53,8 @@ def open_web_gui(parameters):
               list of parameters"
         )
         return False
-    monitor_process = Popen([sys.executable, "-m", "qcodes.monitor.monitor"], shell=True)
+    # The web server runs in its own interpreter, as it changes the working directory.
+    # No shell is needed to start it.
+    monitor_process = Popen([sys.executable, "-m", "qcodes.monitor.monitor"])
     monitor = Monitor(*params)
     return monitor, monitor_process
@@ -23,39 +23,68 @@
 # a file explorer in Tkinter
 
 # import filedialog module
+from __future__ import annotations
+
 import tkinter
-from os import curdir
+from os import curdir, path
 from tkinter import filedialog
 
+_root: tkinter.Tk | None = None
+# Directory of the last selected file, used as start directory of the next dialog
+_last_dir: str | None = None
+
+
+def _raise_root() -> tkinter.Tk:
+    """
+    Returns the hidden Tk root window used as parent of the dialogs, lifted to
+    the top. The root is created only once, as starting Tcl/Tk is slow.
+    """
+    global _root
+    try:
+        exists = _root is not None and bool(_root.winfo_exists())
+    except tkinter.TclError:
+        exists = False
+    if not exists:
+        # Make a top-level instance and hide since it is ugly and big.
+        _root = tkinter.Tk()
+        _root.withdraw()
+        # Make it almost invisible - no decorations, 0 size, top left corner.
+        _root.overrideredirect(True)
+        _root.geometry("0x0+0+0")
+
+    # Show window again and lift it to top so it can get focus,
+    # otherwise dialogs will end up behind the terminal.
+    _root.deiconify()
+    _root.tkraise()
+    _root.focus_force()
+    return _root
+
+
+def _remember_dir(filename: str) -> None:
+    global _last_dir
+    if filename:
+        _last_dir = path.dirname(filename)
+
 
 # Function for opening the file explorer window
 def browsefiles(**kwargs):
     """
     Opens gui for selecting files, returns filepath+name.
     kwargs:
-        initialdir ([str], def: "/"): directory to start at
+        initialdir ([str], def: directory of the last selected file or
+            the current directory): directory to start at
         filetypes ([tuple([str:label],[str: suffix])], def: txt and all files):
             Selectable filetypes
     """
     print("A popup window opened, it is possibly hidden behind other windows...")
-    initialdir = kwargs.get("initialdir", curdir)
+    initialdir = kwargs.get("initialdir", _last_dir or curdir)
     filetypes = kwargs.get("filetypes", (("Text files", "*.txt*"), ("all files", "*.*")))
-    # Make a top-level instance and hide since it is ugly and big.
-    root = tkinter.Tk()
-    root.withdraw()
-    # Make it almost invisible - no decorations, 0 size, top left corner.
-    root.overrideredirect(True)
-    root.geometry("0x0+0+0")
-
-    # Show window again and lift it to top so it can get focus,
-    # otherwise dialogs will end up behind the terminal.
-    root.deiconify()
-    root.tkraise()
-    root.focus_force()
+    root = _raise_root()
     filename = filedialog.askopenfilename(
         parent=root, initialdir=initialdir, title="Select a File", filetypes=filetypes
     )
-    root.destroy()
+    root.withdraw()
+    _remember_dir(filename)
     return filename
 
 
@@ -64,25 +93,17 @@ def browsesavefile(**kwargs):
     Opens gui for creating new file for saving stuff. Returns opened file
     Keep in mind to close it after writing.
     kwargs:
-        initialdir ([str], def: "/"): directory to start at
+        initialdir ([str], def: directory of the last selected file or
+            the current directory): directory to start at
         filetypes ([tuple([str:label],[str: suffix])], def: txt and all files):
             Selectable filetypes
 
     """
-    initialdir = kwargs.get("initialdir", curdir)
+    initialdir = kwargs.get("initialdir", _last_dir or curdir)
     filetypes = kwargs.get("filetypes", (("Text files", "*.txt*"), ("all files", "*.*")))
-    # Make a top-level instance and hide since it is ugly and big.
-    root = tkinter.Tk()
-    root.withdraw()
-    # Make it almost invisible - no decorations, 0 size, top left corner.
-    root.overrideredirect(True)
-    root.geometry("0x0+0+0")
-
-    # Show window again and lift it to top so it can get focus,
-    # otherwise dialogs will end up behind the terminal.
-    root.deiconify()
-    root.tkraise()
-    root.focus_force()
+    root = _raise_root()
     file = tkinter.filedialog.asksaveasfile(parent=root, initialdir=initialdir, filetypes=filetypes)
-    root.destroy()
+    root.withdraw()
+    if file:
+        _remember_dir(file.name)
     return file
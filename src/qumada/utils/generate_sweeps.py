@@ -19,7 +19,8 @@
 # - Sionludi Lab
 
 
-import copy
+from functools import lru_cache
+from types import CodeType
 
 import numpy as np
 
@@ -30,24 +31,41 @@ def generate_sweep(start, stop, num_points, backsweep=False):
     If include_backwars is set True, the array will contain twice as much
     setpoints going from start to stop and back down to start again.
     """
+    sweep = np.linspace(start, stop, num_points)
     if backsweep:
-        sweep = np.array((*np.linspace(start, stop, num_points), *np.linspace(stop, start, num_points)))
-    else:
-        sweep = np.linspace(start, stop, num_points)
+        sweep = np.concatenate((sweep, sweep[::-1]))
     return sweep
 
 
+def _iter_parameter_settings(parameters: dict):
+    """
+    Yields (settings, name, value) for every setting of every parameter, so that
+    settings can be replaced in place via settings[name] = new_value.
+    """
+    for param in parameters.values():
+        for settings in param.values():
+            for name, val in settings.items():
+                yield settings, name, val
+
+
+def _copy_parameters(parameters: dict) -> dict:
+    """
+    Copies the nested dicts of parameters, so that settings can be replaced
+    without modifying the original. The setting values themselves are not
+    copied, as they are only ever replaced, never modified.
+    """
+    return {gate: {x: dict(settings) for x, settings in param.items()} for gate, param in parameters.items()}
+
+
 def replace_parameter_settings(parameters: dict, old_val: str, new_value):
     """
     Replaces parameters based on their values with other value. Can be used to
     pass setpoint arrays to parameter-dicts created from json files without
     having to change the values by hand everytime.
     """
-    for gate, param in parameters.items():
-        for x, y in param.items():
-            for name, val in y.items():
-                if val == old_val:
-                    parameters[gate][x][name] = new_value
+    for settings, name, val in _iter_parameter_settings(parameters):
+        if val == old_val:
+            settings[name] = new_value
     return parameters
 
 
@@ -56,25 +74,28 @@ def update_parameter_settings(parameters: dict, old_val: str, new_value):
     Replaces parameters based on their values with other value. Can be used to
     pass setpoint arrays to parameter-dicts created from json files without
     having to change the values by hand everytime.
-    Does not modify the original dict, but return a modified deep copy.
+    Does not modify the original dict, but return a modified copy. Only the
+    nested dicts are copied, the setting values are shared with the original.
     """
-    updated_parameters = copy.deepcopy(parameters)
-    for gate, param in updated_parameters.items():
-        for x, y in param.items():
-            for name, val in y.items():
-                if val == old_val:
-                    updated_parameters[gate][x][name] = new_value
+    updated_parameters = _copy_parameters(parameters)
+    for settings, name, val in _iter_parameter_settings(updated_parameters):
+        if val == old_val:
+            settings[name] = new_value
     return updated_parameters
 
 
+@lru_cache(maxsize=None)
+def _compile_expression(source: str) -> CodeType:
+    """Compiles an expression from a parameter file once, so repeated loads can reuse it."""
+    return compile(source, "<parameters>", "eval")
+
+
 def parse_code_from_json(parameters):
     """executes simple chunks of python code in strings starting with _"""
-    updated_parameters = copy.deepcopy(parameters)
-    for gate, param in updated_parameters.items():
-        for x, y in param.items():
-            for name, val in y.items():
-                if isinstance(val, str):
-                    if val[0] == "_":
-                        updated_parameters[gate][x][name] = eval(val[1:])
-                        print(val)
+    updated_parameters = _copy_parameters(parameters)
+    for settings, name, val in _iter_parameter_settings(updated_parameters):
+        if isinstance(val, str):
+            if val[0] == "_":
+                settings[name] = eval(_compile_expression(val[1:]))
+                print(val)
     return updated_parameters
@@ -22,19 +22,36 @@ from __future__ import annotations
 
 import importlib
 import pkgutil
+import sys
 from contextlib import suppress
+from functools import lru_cache
 from types import ModuleType
 
 
 def import_submodules(package: str | ModuleType, recursive: bool = True) -> dict[str, ModuleType]:
-    """Import all submodules of a module, recursively, including subpackages"""
-    if isinstance(package, str):
-        package = importlib.import_module(package)
+    """
+    Import all submodules of a module, recursively, including subpackages
+
+    The result is cached per package name, so repeated calls do not walk the
+    package again. Modules added to the package afterwards are not picked up.
+    """
+    if isinstance(package, ModuleType):
+        package = package.__name__
+    # Return a copy, so that callers cannot alter the cached result
+    return dict(_import_submodules(package, recursive))
+
+
+@lru_cache(maxsize=None)
+def _import_submodules(package_name: str, recursive: bool) -> dict[str, ModuleType]:
+    package = importlib.import_module(package_name)
     results = {}
-    for loader, name, is_pkg in pkgutil.walk_packages(package.__path__):
+    # Subpackages are handled by the recursion below. pkgutil.walk_packages would
+    # additionally try to import them by their bare (relative) names.
+    for loader, name, is_pkg in pkgutil.iter_modules(package.__path__):
         full_name = package.__name__ + "." + name
         with suppress(ValueError, ImportError):
-            results[full_name] = importlib.import_module(full_name)
+            module = sys.modules.get(full_name)
+            results[full_name] = module if module is not None else importlib.import_module(full_name)
         if recursive and is_pkg:
-            results.update(import_submodules(full_name))
+            results.update(_import_submodules(full_name, recursive))
     return results
@@ -25,12 +25,14 @@ Loading data from Database
 """
 from __future__ import annotations
 
+from itertools import chain
 from os import path
 
 import numpy as np
 import qcodes as qc
 from qcodes.dataset.data_set import DataSet
 from qcodes.dataset.plotting import plot_dataset
+from qcodes.dataset.sqlite.database import connect
 
 from qumada.utils.browsefiles import browsefiles
 
@@ -41,15 +43,17 @@ def flatten_list(lst: list) -> list:
     Flattens nested lists
     """
     results = []
-
-    def rec(sublist, results):
-        for entry in sublist:
+    # Iterators of the lists currently being flattened, innermost last.
+    # Avoids recursion, so deeply nested lists do not hit the recursion limit.
+    stack = [iter(lst)]
+    while stack:
+        for entry in stack[-1]:
             if isinstance(entry, list):
-                rec(entry, results)
-            else:
-                results.append(entry)
-
-    rec(lst, results)
+                stack.append(iter(entry))
+                break
+            results.append(entry)
+        else:
+            stack.pop()
     return results
 
 
@@ -101,7 +105,12 @@ def list_sample_names() -> set[str]:
     """
     Lists all sample names that appear in the database
     """
-    name_set = {measurement.sample_name for measurement in qc.experiments()}
+    # Query the names directly instead of loading every experiment
+    conn = connect(qc.config.core.db_location)
+    try:
+        name_set = {row[0] for row in conn.execute("SELECT DISTINCT sample_name FROM experiments")}
+    finally:
+        conn.close()
     return name_set
 
 
@@ -111,7 +120,8 @@ def _pick_sample_name() -> str:
     Lists all samples and allows the user to pick one.
     Returns String with sample name
     """
-    samples = list(list_sample_names())
+    # Sorted, so the numbering of the samples does not change between calls
+    samples = sorted(list_sample_names())
     print("Please choose a sample:")
     for idx, sample in enumerate(samples):
         print(f"{idx}: {sample}")
@@ -119,7 +129,7 @@ def _pick_sample_name() -> str:
         try:
             chosen = samples[int(input("Enter sample number: "))]
             return chosen
-        except Exception:
+        except (ValueError, IndexError):
             print("Please chose a valid entry")
 
 
@@ -140,10 +150,6 @@ def list_measurements_for_sample(sample_name: str | None = None) -> list[qc.Data
     """
     if not sample_name:
         sample_name = _pick_sample_name()
-    try:
-        qc.load_by_run_spec(sample_name=sample_name)
-    except NameError:
-        pass
     return _list_measurements_for_sample(sample_name)
 
 
@@ -152,11 +158,19 @@ def _list_measurements_for_sample(sample_name: str | None = None) -> list[qc.Dat
     """
     Returns flattened list containing all datasets belonging to the sample specified
     """
-    datasets = []
-    for experiment in qc.experiments():
-        if experiment.sample_name == sample_name:
-            datasets.append([*(dataset for dataset in experiment.data_sets())])
-    return flatten_list(datasets)
+    # Look up the matching runs with a single query instead of loading every experiment
+    conn = connect(qc.config.core.db_location)
+    try:
+        run_ids = [
+            row[0]
+            for row in conn.execute(
+                "SELECT run_id FROM runs JOIN experiments USING(exp_id) WHERE sample_name = ? ORDER BY exp_id, run_id",
+                (sample_name,),
+            )
+        ]
+    finally:
+        conn.close()
+    return [qc.load_by_id(run_id) for run_id in run_ids]
 
 
 # %%
@@ -164,8 +178,7 @@ def _flatten_experiment_container() -> list[qc.DataSet]:
     """
     Returns flattened list of all datasets in the currently loaded .db
     """
-    datasets = [*(experiment.data_sets() for experiment in qc.experiments())]
-    return flatten_list(datasets)
+    return list(chain.from_iterable(experiment.data_sets() for experiment in qc.experiments()))
 
 
 # %%
@@ -221,25 +234,20 @@ def plot_data(sample_name: str = None):
     Simple plotting of datasets from the QCoDeS DB.
     """
     dataset = pick_measurement(sample_name=sample_name, preview_dialogue=False)
-    independend_parameters = list()
-    dependend_parameters = list()
-    for parameter in dataset.get_parameters():
-        if len(parameter._depends_on) == 0:
-            independend_parameters.append(parameter)
-        else:
-            dependend_parameters.append(parameter)
+    dependend_parameters = [parameter for parameter in dataset.get_parameters() if parameter._depends_on]
     print("Which parameter do you want to plot?")
     for idx, parameter in enumerate(dependend_parameters):
         print(f"{idx} : {parameter.label}")
     plot_param_numbers = input("Please enter the numbers of the parameters you want to plot, separated by blank")
-    plot_params = list()
-    for param in plot_param_numbers:
-        plot_params.append(dependend_parameters[int(param)].name)
+    plot_params = [dependend_parameters[int(number)].name for number in plot_param_numbers.split()]
     print(plot_params)
+    # Fetch the data of all chosen parameters at once instead of querying per access
+    all_data = dataset.get_parameter_data(*plot_params)
     for param in plot_params:
-        y_data = dataset.get_parameter_data(param)[param][param]
-        print(dataset.get_parameter_data(param)[param])
-        x_data = dataset.get_parameter_data(param)[param][dependend_parameters[0].name]
+        param_data = all_data[param]
+        y_data = param_data[param]
+        print(param_data)
+        x_data = param_data[dataset.paramspecs[param]._depends_on[0]]
 
         print(y_data)
         print(x_data)
@@ -271,9 +279,10 @@ def get_parameter_data(dataset=None, parameter_name=None, **kwargs):
     params = (*independent_param, parameter_name)
     labels = (*(dataset.paramspecs[i_p].label for i_p in independent_param), chosen_param.label)
     units = (*(dataset.paramspecs[i_p].unit for i_p in independent_param), chosen_param.unit)
+    parameter_data = dataset.get_parameter_data(parameter_name)[parameter_name]
     data = (
-        *tuple(dataset.get_parameter_data(parameter_name)[parameter_name][param] for param in independent_param),
-        dataset.get_parameter_data(parameter_name)[parameter_name][parameter_name],
+        *(parameter_data[param] for param in independent_param),
+        parameter_data[parameter_name],
     )
     return zip(params, data, units, labels)
 
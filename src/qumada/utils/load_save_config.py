@@ -20,14 +20,38 @@
 
 
 import configparser
+import os
+
+# Parsed config files by path, with the modification time and size they were read at
+_config_cache: dict[str, tuple[int, int, configparser.ConfigParser]] = {}
+
+
+def _read_config(config_file) -> configparser.ConfigParser:
+    """
+    Returns the parsed config file. The file is only parsed again if it has
+    been modified since it was last read.
+    """
+    path = os.path.abspath(config_file)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # Missing files result in an empty config, as with ConfigParser.read
+        _config_cache.pop(path, None)
+        return configparser.ConfigParser()
+    cached = _config_cache.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    config = configparser.ConfigParser()
+    config.read(path)
+    _config_cache[path] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
 
 
 def load_from_config(section, key, config_file="../config.cfg"):
     """
     Helps you to load settings from the config file.
     """
-    config = configparser.ConfigParser()
-    config.read(config_file)
+    config = _read_config(config_file)
     if section in config:
         if key in config[section]:
             return config[section][key]
@@ -46,4 +70,5 @@ def save_to_config(section, key, value, config_file="../config.cfg"):
     config[section][key] = value
     with open(config_file, "w") as configfile:
         config.write(configfile)
+    _config_cache.pop(os.path.abspath(config_file), None)
     return None
@@ -23,19 +23,17 @@ from __future__ import annotations
 
 import json
 import operator
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from os import PathLike
 from pathlib import Path
 
-import numpy as np
-import pandas as pd
-
 
 class ParameterDict(dict):
     """Changes operator | and |= of dict to overwrite entries, that are dict and have a key 'type'."""
 
     def __or__(self, other):
-        new = self.__class__(**self)
+        new = self.__class__(self)
         new |= other
         return new
 
@@ -50,24 +48,35 @@ class ParameterDict(dict):
         return self
 
 
+@contextmanager
+def parameter_session(parameter_file_path: str | PathLike) -> Iterator[ParameterDict]:
+    """
+    Read the parameters from a file once, yield them for modification and write
+    them back once when the block is left without an exception.
+    Use this instead of several calls of update_parameters for the same file.
+    """
+    path = Path(parameter_file_path)
+    try:
+        parameters = json.loads(path.read_text(), object_pairs_hook=ParameterDict)
+    except FileNotFoundError:
+        parameters = ParameterDict()
+    yield parameters
+    path.write_text(json.dumps(parameters, indent=2))
+
+
 def update_parameters(parameter_file_path: str | PathLike, new_parameters: ParameterDict):
     """Write or overwrite parameters to a file."""
-    path = Path(parameter_file_path)
-    existing_parameters = json.load(path.open("r" if path.exists() else "x"), object_pairs_hook=ParameterDict)
-    parameters = existing_parameters | new_parameters
-    json.dump(parameters, path.open("w"), indent=2)
+    with parameter_session(parameter_file_path) as parameters:
+        parameters |= new_parameters
     return parameters
 
 
 def intialize_dac_parameter_file(mapping, parameter_file_path: str | PathLike):
     """Write new dac parameter file with dummy channels before relevant entries."""
+    # All entries are identical gettable settings, so a plain update replaces the merge
     parameters = ParameterDict()
     for i in range(20):
-        if i in mapping.keys():
-            key = mapping[i]
-        else:
-            key = f"CH{i}"
-        parameters |= gettable_dac_entry(key)
+        parameters.update(gettable_dac_entry(mapping.get(i, f"CH{i}")))
 
     return update_parameters(parameter_file_path, parameters)
 
@@ -79,10 +88,19 @@ def excel_to_dac_parameter_file(
     dac_header="DAC/AWG",
 ):
     """Read dac parameters from Excel file and save them (with dummy channels) to new parameter file."""
-    excel = pd.read_excel(excel_file, usecols=[sample_header, dac_header])
-    mapping = ParameterDict(
-        {int(dac): sample for dac, sample in zip(excel["DAC/AWG"], excel["Sample"]) if not np.isnan(dac)}
-    )
+    from openpyxl import load_workbook
+
+    # Stream the rows of the first sheet instead of loading it into a DataFrame.
+    workbook = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows)
+        sample_col, dac_col = header.index(sample_header), header.index(dac_header)
+        mapping = ParameterDict(
+            (int(row[dac_col]), row[sample_col]) for row in rows if len(row) > dac_col and row[dac_col] is not None
+        )
+    finally:
+        workbook.close()
 
     return intialize_dac_parameter_file(mapping, parameter_file_path)
 
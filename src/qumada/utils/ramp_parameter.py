@@ -25,6 +25,7 @@ from __future__ import annotations
 import logging
 import time
 from math import isclose
+from numbers import Integral, Real
 
 from qumada.utils.generate_sweeps import generate_sweep
 
@@ -91,13 +92,16 @@ def ramp_parameter(
         LOG.warning(f"{parameter} is not _settable and cannot be ramped!")
         return False
     current_value = parameter.get()
-    LOG.debug(f"parameter: {parameter}")
-    LOG.debug(f"current value: {current_value}")
-    LOG.debug(f"ramp rate: {ramp_rate}")
-    LOG.debug(f"ramp time: {ramp_time}")
-
-    if isinstance(current_value, float):
-        LOG.debug(f"target: {target}")
+    LOG.debug("parameter: %s", parameter)
+    LOG.debug("current value: %s", current_value)
+    LOG.debug("ramp rate: %s", ramp_rate)
+    LOG.debug("ramp time: %s", ramp_time)
+
+    # Any non-integer real number (e.g. numpy.float32) can be ramped. Integer
+    # (and bool) values are not, as intermediate values would be invalid.
+    if isinstance(current_value, Real) and not isinstance(current_value, Integral):
+        current_value = float(current_value)
+        LOG.debug("target: %s", target)
         if isclose(current_value, target, rel_tol=tolerance):
             LOG.debug("Target value is sufficiently close to current_value, no need to ramp")
             return True
@@ -124,11 +128,17 @@ def ramp_parameter(
                 valid_units=valid_units,
                 **kwargs,
             )
-        sweep = generate_sweep(parameter.get(), target, num_points)
-        LOG.debug(f"sweep: {sweep}")
-        for value in sweep:
+        sweep = generate_sweep(current_value, target, num_points)
+        LOG.debug("sweep: %s", sweep)
+        # Sleep until the next step is due, so the time needed to set the
+        # values does not add up over the ramp. There is no need to wait
+        # after the target value has been set.
+        deadline = time.perf_counter()
+        parameter.set(sweep[0])
+        for value in sweep[1:]:
+            deadline += setpoint_intervall
+            time.sleep(max(0, deadline - time.perf_counter()))
             parameter.set(value)
-            time.sleep(setpoint_intervall)
         return True
     else:
         raise Unsweepable_parameter("Parameter has non-float values")
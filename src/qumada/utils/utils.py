@@ -28,16 +28,25 @@ def flatten_array(lst) -> list:
     """
     Flattens nested lists and arrays, returns flattened list
     """
+    # Fast path for (lists of) numeric arrays, as returned by most buffers
+    if isinstance(lst, np.ndarray) and lst.dtype != object:
+        return list(lst.ravel())
+    if isinstance(lst, list) and lst and all(isinstance(entry, np.ndarray) for entry in lst):
+        dtypes = {entry.dtype for entry in lst}
+        if len(dtypes) == 1 and object not in dtypes:
+            return list(np.concatenate([entry.ravel() for entry in lst]))
     results = []
-
-    def rec(sublist, results):
-        for entry in sublist:
-            if isinstance(entry, list) or isinstance(entry, np.ndarray):
-                rec(entry, results)
-            else:
-                results.append(entry)
-
-    rec(lst, results)
+    # Iterators of the lists/arrays currently being flattened, innermost last.
+    # Avoids recursion, so deeply nested inputs do not hit the recursion limit.
+    stack = [iter(lst)]
+    while stack:
+        for entry in stack[-1]:
+            if isinstance(entry, (list, np.ndarray)):
+                stack.append(iter(entry))
+                break
+            results.append(entry)
+        else:
+            stack.pop()
     return results
 
 